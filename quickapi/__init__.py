@@ -11,7 +11,13 @@ from .exceptions import (  # noqa: F401
     RequestSerializationError,
     ResponseSerializationError,
 )
-from .http_client import BaseHttpClient, HTTPxClient, RequestsClient  # noqa: F401
+from .http_client import (  # noqa: F401
+    BaseHttpClient,
+    HTTPxAsyncClient,
+    HTTPxClient,
+    RequestsClient,
+    configure_default_client,
+)
 
 # TODO: should we check optional dep before import?
 from .serializers import (  # noqa: F401
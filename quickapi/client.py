@@ -1,3 +1,7 @@
+import asyncio
+import copy
+import functools
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Generic, TypeVar, get_args
@@ -14,7 +18,9 @@ from .http_client import (
     BaseHttpClient,
     BaseHttpClientAuth,
     BaseHttpClientResponse,
+    HTTPxAsyncClient,
     HTTPxClient,
+    _new_default_async_client,
 )
 from .serializers import (
     DictSerializable,
@@ -24,9 +30,11 @@ from .serializers import (
 USE_DEFAULT = object()
 
 ResponseBodyT = TypeVar("ResponseBodyT")
+_ValuesT = TypeVar("_ValuesT")
+_ConvertedT = TypeVar("_ConvertedT")
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseResponse(Generic[ResponseBodyT]):
     client_response: BaseHttpClientResponse
     body: ResponseBodyT
@@ -44,9 +52,61 @@ class BaseApiMethod(str, Enum):
     HEAD = "HEAD"
     TRACE = "TRACE"
 
-    @staticmethod
-    def values() -> dict[str, Enum]:
-        return BaseApiMethod._value2member_map_
+
+_SUPPORTED_METHODS = frozenset({
+    BaseApiMethod.GET,
+    BaseApiMethod.OPTIONS,
+    BaseApiMethod.HEAD,
+    BaseApiMethod.POST,
+    BaseApiMethod.PUT,
+    BaseApiMethod.PATCH,
+    BaseApiMethod.DELETE,
+})
+_METHODS_WITH_BODY = frozenset({
+    BaseApiMethod.POST,
+    BaseApiMethod.PUT,
+    BaseApiMethod.PATCH,
+})
+
+# The responses that never have a body to convert, e.g. when listed in `ok_status_codes`
+_NO_CONTENT_STATUS_CODES = frozenset({204, 205})
+
+_REQUIRED_ATTRIBUTES = ("url", "response_body")
+_HTTP_CLIENT_ATTRIBUTES = ("http_client", "async_http_client")
+
+
+@functools.cache
+def _get_generic_type(generic_alias: object) -> object:
+    # Usually the same few `BaseApi[ResponseBody]` aliases, so worth caching
+    return get_args(generic_alias)[0]
+
+
+def _resolve_or_defer(
+    resolve: Callable[[], Callable[[_ValuesT], _ConvertedT]],
+) -> Callable[[_ValuesT], _ConvertedT]:
+    """
+    Resolve a (de)serializer right away, or on its first call instead when the
+    class refers to others that aren't defined yet (e.g. with
+    `from __future__ import annotations`).
+    """
+    try:
+        return resolve()
+    except NameError:
+        pass
+
+    resolved: Callable[[_ValuesT], _ConvertedT] | None = None
+
+    def resolve_on_first_call(values: _ValuesT) -> _ConvertedT:
+        nonlocal resolved
+        if resolved is None:
+            resolved = resolve()
+        return resolved(values)
+
+    return resolve_on_first_call
+
+
+# Shared by all the requests without params/body, so it must never be modified
+_NO_VALUES: dict = {}
 
 
 class BaseApi(Generic[ResponseBodyT]):
@@ -59,50 +119,113 @@ class BaseApi(Generic[ResponseBodyT]):
     request_body: type[DictSerializableT] | None = None
     response_body: type[ResponseBodyT]
     http_client: BaseHttpClient | None = None
+    async_http_client: BaseHttpClient | None = None
+    enable_http_cache: bool = False
+    cache_response_body: bool = False
+    omit_request_defaults: bool = False
+    ok_status_codes: frozenset[int] = frozenset({200})
 
     _http_client: BaseHttpClient = HTTPxClient()
+    _async_http_client: BaseHttpClient = HTTPxAsyncClient()
     _request_params: "DictSerializableT | None" = None
     _request_body: "DictSerializableT | None" = None
     _response_body_cls: type[ResponseBodyT]
     _response: BaseResponse[ResponseBodyT] | None = None
 
+    # Used for conditional requests when `enable_http_cache` is set
+    _last_request: tuple[dict | None, dict | None] | None = None
+    _last_etag: str | None = None
+    _last_modified: str | None = None
+
+    _request_params_to_dict: Callable[["DictSerializableT"], dict | None] = (
+        DictSerializable.to_dict
+    )
+    _request_body_to_dict: Callable[["DictSerializableT"], dict | None] = (
+        DictSerializable.to_dict
+    )
+    _response_body_from_json: Callable[[bytes], ResponseBodyT]
+    _http_method: str | None
+    _sends_body: bool
+
     @classmethod
     def __init_subclass__(cls, **kwargs: object) -> None:
         super().__init_subclass__(**kwargs)
         cls._validate_subclass()
 
         if cls.request_params is not None:
-            cls._request_params = cls.request_params()
+            cls._request_params_to_dict = staticmethod(
+                _resolve_or_defer(
+                    functools.partial(
+                        DictSerializable.resolve_to_dict,
+                        cls.request_params,
+                        omit_defaults=cls.omit_request_defaults,
+                    )
+                )
+            )
 
         if cls.request_body is not None:
-            cls._request_body = cls.request_body()
+            cls._request_body_to_dict = staticmethod(
+                _resolve_or_defer(
+                    functools.partial(
+                        DictSerializable.resolve_to_dict,
+                        cls.request_body,
+                        omit_defaults=cls.omit_request_defaults,
+                    )
+                )
+            )
 
         cls._response_body_cls = cls.response_body  # pyright: ignore [reportGeneralTypeIssues]
+        # Resolve the (de)serializers once per subclass instead of on every request
+        cls._response_body_from_json = staticmethod(
+            _resolve_or_defer(
+                functools.partial(
+                    DictSerializable.resolve_from_json,
+                    cls._response_body_cls,
+                    cached=cls.cache_response_body,
+                )
+            )
+        )
+
+        # The method is fixed per subclass, so decide how to send it only once
+        cls._http_method = (
+            cls.method.value if cls.method in _SUPPORTED_METHODS else None
+        )
+        cls._sends_body = cls.method in _METHODS_WITH_BODY
 
         if cls.http_client is not None:
             cls._http_client = cls.http_client
 
+        if cls.async_http_client is not None:
+            cls._async_http_client = cls.async_http_client
+
     @classmethod
     def _validate_subclass(cls) -> None:
-        if getattr(cls, "url", None) is None:
-            raise ClientSetupError(attribute="url")
+        # These are usually inherited from a parent API, so they can't be looked
+        # up in the subclass `__dict__` only
+        for attribute in _REQUIRED_ATTRIBUTES:
+            if getattr(cls, attribute, None) is None:
+                raise ClientSetupError(attribute=attribute)
 
-        if getattr(cls, "response_body", None) is None:
-            raise ClientSetupError(attribute="response_body")
+        # The rest always have a default set on `BaseApi`
+        if cls.method is not None and not isinstance(cls.method, BaseApiMethod):
+            # A plain string such as "POST" is still accepted
+            try:
+                cls.method = BaseApiMethod(cls.method)
+            except ValueError as e:
+                raise ClientSetupError(attribute="method") from e
 
-        if (
-            getattr(cls, "method", None) is not None
-            and cls.method not in BaseApiMethod.values()
-        ):
-            raise ClientSetupError(attribute="method")
+        for attribute in _HTTP_CLIENT_ATTRIBUTES:
+            http_client = getattr(cls, attribute)
+            if http_client is not None and not isinstance(http_client, BaseHttpClient):
+                raise ClientSetupError(attribute=attribute)
 
-        if getattr(cls, "http_client", None) is not None and not (
-            isinstance(cls.http_client, BaseHttpClient)
+        # An inherited `__orig_bases__` is a parent API's, which was already
+        # checked when it was defined, unless it's the one of `BaseApi` itself
+        orig_bases = getattr(cls, "__orig_bases__", None)
+        if orig_bases is not None and (
+            "__orig_bases__" in vars(cls) or orig_bases is BaseApi.__orig_bases__  # type: ignore [attr-defined]
         ):
-            raise ClientSetupError(attribute="http_client")
-
-        if getattr(cls, "__orig_bases__", None) is not None:
-            response_body_generic_type = get_args(cls.__orig_bases__[0])[0]  # type: ignore [attr-defined]
+            response_body_generic_type = _get_generic_type(orig_bases[0])
             if (
                 isinstance(response_body_generic_type, TypeVar)
                 and response_body_generic_type.__name__ == "ResponseBodyT"
@@ -115,11 +238,13 @@ class BaseApi(Generic[ResponseBodyT]):
         request_body: "DictSerializableT | None" = None,
         http_client: BaseHttpClient | None = None,
         auth: BaseHttpClientAuth = USE_DEFAULT,
+        async_http_client: BaseHttpClient | None = None,
     ) -> None:
-        self._request_params = request_params or self._request_params
-        self._request_body = request_body or self._request_body
-        self._http_client = http_client or self._http_client
-        self.auth = auth if auth != USE_DEFAULT else self.auth
+        self._set_request(request_params, request_body, auth)
+        if http_client:
+            self._http_client = http_client
+        if async_http_client:
+            self._async_http_client = async_http_client
 
     def execute(
         self,
@@ -130,84 +255,238 @@ class BaseApi(Generic[ResponseBodyT]):
     ) -> BaseResponse[ResponseBodyT]:
         """Execute the API request and return the response."""
 
-        self._request_params = request_params or self._request_params
-        self._request_body = request_body or self._request_body
-        self._http_client = http_client or self._http_client
-        self.auth = auth if auth != USE_DEFAULT else self.auth
+        client_response = self.execute_raw(
+            request_params, request_body, http_client, auth
+        )
+
+        return self._build_response(client_response)
+
+    def execute_body(
+        self,
+        request_params: "DictSerializableT | None" = None,
+        request_body: "DictSerializableT | None" = None,
+        http_client: BaseHttpClient | None = None,
+        auth: BaseHttpClientAuth = USE_DEFAULT,
+    ) -> ResponseBodyT:
+        """
+        Execute the API request and return only the response body.
+
+        Same as `execute().body`, but without wrapping it in a `BaseResponse`.
+        """
+
+        client_response = self.execute_raw(
+            request_params, request_body, http_client, auth
+        )
+
+        if self.enable_http_cache:
+            # The whole response is kept to be reused when it's not modified
+            return self._build_response(client_response).body
+        return self._build_body(client_response)
+
+    def execute_raw(
+        self,
+        request_params: "DictSerializableT | None" = None,
+        request_body: "DictSerializableT | None" = None,
+        http_client: BaseHttpClient | None = None,
+        auth: BaseHttpClientAuth = USE_DEFAULT,
+    ) -> BaseHttpClientResponse:
+        """
+        Execute the API request and return the response of the http client as is,
+        without checking its status code or converting its body.
+        """
+
+        self._set_request(request_params, request_body, auth)
+        if http_client:
+            self._http_client = http_client
+
+        http_method, http_client_kwargs = self._build_request()
+        client_response: BaseHttpClientResponse = self._http_client.request(
+            http_method, **http_client_kwargs
+        )
+        return client_response
+
+    async def aexecute(
+        self,
+        request_params: "DictSerializableT | None" = None,
+        request_body: "DictSerializableT | None" = None,
+        http_client: BaseHttpClient | None = None,
+        auth: BaseHttpClientAuth = USE_DEFAULT,
+    ) -> BaseResponse[ResponseBodyT]:
+        """
+        Execute the API request asynchronously and return the response.
+
+        Without an `async_http_client`, each call opens and closes its own
+        connection, see `gather` to send several requests over the same ones.
+        """
+
+        self._set_request(request_params, request_body, auth)
+        if http_client:
+            self._async_http_client = http_client
+
+        return await self._aexecute(self._async_http_client)
+
+    @staticmethod
+    async def gather(
+        apis: "Iterable[BaseApi[ResponseBodyT]]",
+    ) -> list[BaseResponse[ResponseBodyT]]:
+        """Execute several API requests concurrently and return their responses."""
+
+        apis = list(apis)
+        if not any(api._uses_default_async_client() for api in apis):
+            return await asyncio.gather(
+                *(api._aexecute(api._async_http_client) for api in apis)
+            )
+
+        # Share a single connection pool between all the requests that would
+        # otherwise each open and close their own
+        async with _new_default_async_client() as client:
+            shared_http_client = HTTPxAsyncClient(client)
+            return await asyncio.gather(
+                *(
+                    api._aexecute(
+                        shared_http_client
+                        if api._uses_default_async_client()
+                        else api._async_http_client
+                    )
+                    for api in apis
+                )
+            )
+
+    async def _aexecute(
+        self, async_http_client: BaseHttpClient
+    ) -> BaseResponse[ResponseBodyT]:
+        http_method, http_client_kwargs = self._build_request()
+        client_response = await async_http_client.request(
+            http_method, **http_client_kwargs
+        )
+
+        return self._build_response(client_response)
+
+    def _uses_default_async_client(self) -> bool:
+        return (
+            isinstance(self._async_http_client, HTTPxAsyncClient)
+            and self._async_http_client.uses_default_client
+        )
+
+    def _set_request(
+        self,
+        request_params: "DictSerializableT | None",
+        request_body: "DictSerializableT | None",
+        auth: BaseHttpClientAuth,
+    ) -> None:
+        # Only what's given is stored, instead of writing back the current
+        # values to the instance on every single request
+        if request_params:
+            self._request_params = request_params
+        if request_body:
+            self._request_body = request_body
+        if auth is not USE_DEFAULT:
+            self.auth = auth
+
+    def _build_request(self) -> tuple[str, dict]:
+        http_method = self._http_method
+        if http_method is None:
+            raise NotImplementedError(f"Method {self.method} not implemented.")
+
+        # The defaults are only created once they're needed, and then kept on
+        # this instance so they aren't shared with any other instance
+        if self._request_params is None and self.request_params is not None:
+            self._request_params = self.request_params()
+
+        # The body is only serialized for the methods that actually send it
+        sends_body = self._sends_body
+        if sends_body and self._request_body is None and self.request_body is not None:
+            self._request_body = self.request_body()
+
         try:
             params = (
-                DictSerializable.to_dict(self._request_params)
+                self._request_params_to_dict(self._request_params)
                 if self._request_params
-                else {}
+                else _NO_VALUES
             )
             json = (
-                DictSerializable.to_dict(self._request_body)
-                if self._request_body
-                else {}
+                self._request_body_to_dict(self._request_body)
+                if sends_body and self._request_body
+                else _NO_VALUES
             )
         except DictDeserializationError as e:
             raise RequestSerializationError(expected_type=e.expected_type) from e
 
-        match self.method:
-            case BaseApiMethod.GET:
-                client_response = self._http_client.get(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                )
-            case BaseApiMethod.OPTIONS:
-                client_response = self._http_client.options(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                )
-            case BaseApiMethod.HEAD:
-                client_response = self._http_client.head(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                )
-            case BaseApiMethod.POST:
-                client_response = self._http_client.post(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                    json=json,
-                )
-            case BaseApiMethod.PUT:
-                client_response = self._http_client.put(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                    json=json,
-                )
-            case BaseApiMethod.PATCH:
-                client_response = self._http_client.patch(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                    json=json,
-                )
-            case BaseApiMethod.DELETE:
-                client_response = self._http_client.delete(
-                    url=self.url,
-                    auth=self.auth,
-                    params=params,
-                )
-            case _:
-                raise NotImplementedError(f"Method {self.method} not implemented.")
+        http_client_kwargs = {"url": self.url, "auth": self.auth}
+        # No params leave the URL as is, so skip having the client merge them in.
+        # An empty body is still sent, as `{}` isn't the same as no body at all.
+        if params:
+            http_client_kwargs["params"] = params
+        if sends_body:
+            http_client_kwargs["json"] = json
 
-        # TODO: Add support for handling different response status codes
-        if client_response.status_code != 200:
-            raise HTTPError(client_response.status_code)
+        if self.enable_http_cache:
+            http_client_kwargs["headers"] = self._build_cache_headers(params, json)
 
-        try:
-            body = DictSerializable.from_dict(
-                self._response_body_cls, client_response.json()
-            )
-        except DictSerializationError as e:
-            raise ResponseSerializationError(expected_type=e.expected_type) from e
+        return http_method, http_client_kwargs
+
+    def _build_cache_headers(self, params: dict | None, json: dict | None) -> dict:
+        """
+        Build the conditional request headers, so that the server can reply with
+        `HTTP 304 (Not Modified)` if the last response is still valid.
+        """
+        headers = {}
+        request = (params, json)
+        if self._response is not None and self._last_request == request:
+            if self._last_etag is not None:
+                headers["If-None-Match"] = self._last_etag
+            if self._last_modified is not None:
+                headers["If-Modified-Since"] = self._last_modified
+        else:
+            self._last_etag = self._last_modified = None
+        # Copied, as plain dicts are sent as is and could be changed in place
+        self._last_request = copy.deepcopy(request)
+        return headers
+
+    def _build_response(
+        self,
+        client_response: BaseHttpClientResponse,
+    ) -> BaseResponse[ResponseBodyT]:
+        if (
+            client_response.status_code == 304
+            and self.enable_http_cache
+            and self._response is not None
+            and (self._last_etag is not None or self._last_modified is not None)
+        ):
+            # Nothing changed since the last response, so it can be reused as is
+            return self._response
+
+        if self.enable_http_cache:
+            # Only saved once the body was converted, so that a response that
+            # failed to convert is never reused on a `304`
+            self._last_etag = self._last_modified = None
 
-        self._response = BaseResponse(client_response=client_response, body=body)
+        self._response = BaseResponse(
+            client_response=client_response, body=self._build_body(client_response)
+        )
+
+        if self.enable_http_cache:
+            self._last_etag = client_response.headers.get("etag")
+            self._last_modified = client_response.headers.get("last-modified")
 
         return self._response
+
+    def _build_body(
+        self,
+        client_response: BaseHttpClientResponse,
+    ) -> ResponseBodyT:
+        status_code = client_response.status_code
+        if status_code not in self.ok_status_codes:
+            raise HTTPError(status_code)
+
+        # A `HEAD` response is normally empty, even though a server could still
+        # send the body it would have sent for a `GET`
+        if status_code in _NO_CONTENT_STATUS_CODES or (
+            self.method is BaseApiMethod.HEAD and not client_response.content
+        ):
+            return None  # type: ignore [return-value]
+
+        try:
+            return self._response_body_from_json(client_response.content)
+        except DictSerializationError as e:
+            raise ResponseSerializationError(expected_type=e.expected_type) from e
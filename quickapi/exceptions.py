@@ -3,7 +3,7 @@ class QuickApiException(Exception):
 
 
 class ClientSetupError(QuickApiException):
-    """An error setting up the BaseClient subclass."""
+    """An error setting up the BaseApi subclass."""
 
     def __init__(self, attribute: str):
         message = f"Subclass setup error. Missing or invalid required attribute `{attribute}`."
@@ -11,11 +11,15 @@ class ClientSetupError(QuickApiException):
 
 
 class HTTPError(QuickApiException):
-    """The response received a non `200` response status code."""
+    """The response received an unexpected response status code."""
 
     def __init__(self, status_code: int):
-        message = f"HTTP request received a non `HTTP 200 (OK)` response. The response status code was `{status_code}`."
-        super().__init__(message)
+        self.status_code = status_code
+        super().__init__(status_code)
+
+    def __str__(self) -> str:
+        # Only built when needed, as callers often just check the `status_code`
+        return f"HTTP request received an unexpected response. The response status code was `{self.status_code}`."
 
 
 class DictSerializationError(QuickApiException):
@@ -1,83 +1,215 @@
-from abc import ABC, abstractmethod
-from typing import TypeAlias
+import importlib.util
+import threading
+from typing import TYPE_CHECKING, Protocol, TypeAlias, runtime_checkable
 
 import httpx
 
 from .exceptions import MissingDependencyError
 
-try:
+if TYPE_CHECKING:
     import requests
-except ImportError:
-    requests_installed = False
-else:
-    requests_installed = True
+
+# Only look requests up, it's imported when a `RequestsClient` is first created
+# as it pulls in a lot of modules that most users of the default client never need.
+requests_installed = importlib.util.find_spec("requests") is not None
 
 # TODO: Fix types
 BaseHttpClientAuth: TypeAlias = "httpx.Auth | requests.auth.AuthBase | object | None"
-BaseHttpClientResponse: TypeAlias = "httpx.Response | requests.Response | None"
+BaseHttpClientResponse: TypeAlias = "httpx.Response | requests.Response"
 
+DEFAULT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+# Same as httpx's own default
+DEFAULT_TIMEOUT = httpx.Timeout(5.0)
 
-class BaseHttpClient(ABC):
-    """Base interface for all HTTP clients."""
+_default_limits = DEFAULT_LIMITS
+_default_timeout = DEFAULT_TIMEOUT
 
-    @abstractmethod
-    def __init__(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+# Shared by every `HTTPxClient` that isn't given its own client, so that all the
+# APIs reuse the same connection pool instead of each opening new connections.
+_default_client: httpx.Client | None = None
+_default_client_lock = threading.Lock()
 
-    @abstractmethod
-    def get(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
 
-    @abstractmethod
-    def options(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
+def _get_default_client() -> httpx.Client:
+    global _default_client
+    if _default_client is None:
+        # Checked again with the lock held, so that two threads sending their
+        # first request at the same time don't both create a client
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = httpx.Client(
+                    limits=_default_limits, timeout=_default_timeout
+                )
+    return _default_client
 
-    @abstractmethod
-    def head(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
 
-    @abstractmethod
-    def post(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
+def _new_default_async_client() -> httpx.AsyncClient:
+    # An async connection pool can only be used from the event loop it was
+    # created in, so these are never shared and must be closed after use.
+    return httpx.AsyncClient(limits=_default_limits, timeout=_default_timeout)
 
-    @abstractmethod
-    def put(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
 
-    @abstractmethod
-    def patch(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
+def configure_default_client(
+    limits: httpx.Limits = DEFAULT_LIMITS,
+    timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+) -> None:
+    """
+    Replace the default shared httpx client with one using the given settings.
 
-    @abstractmethod
-    def delete(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        raise NotImplementedError
+    The async clients created when none is given use the same settings.
+    """
+    global _default_client, _default_limits, _default_timeout
+    with _default_client_lock:
+        _default_limits = limits
+        _default_timeout = timeout
+        if _default_client is not None:
+            _default_client.close()
+        _default_client = httpx.Client(limits=limits, timeout=timeout)
+
+
+_VERB_METHODS = ("get", "options", "head", "post", "put", "patch", "delete")
+
+
+def _dispatch_overridden_verbs(klass: type, base: type) -> None:
+    """
+    Have `request` call the verb methods again when a subclass of one of the
+    clients below overrides any of them, as these don't call them otherwise.
+    """
+    if "request" not in vars(klass) and any(
+        getattr(klass, verb) is not getattr(base, verb) for verb in _VERB_METHODS
+    ):
+        klass.request = BaseHttpClient.request  # type: ignore [attr-defined]
+
+
+@runtime_checkable
+class BaseHttpClient(Protocol):
+    """
+    Base interface for all HTTP clients.
+
+    Any class with these methods can be used as a client, subclassing it is only
+    needed to get the default `request` implementation.
+    """
+
+    def request(self, method: str, *args, **kwargs):  # type: ignore [no-untyped-def]
+        """Send a request with the given HTTP `method`, using its own method by default."""
+        return getattr(self, method.lower())(*args, **kwargs)
+
+    def get(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+
+    def options(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+
+    def head(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+
+    def post(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+
+    def put(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+
+    def patch(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
+
+    def delete(self, *args, **kwargs): ...  # type: ignore [no-untyped-def]
 
 
 class HTTPxClient(BaseHttpClient):
-    """A thin wrapper around HTTPx. This is the default client."""
+    """
+    A thin wrapper around HTTPx. This is the default client.
+
+    Unless a client is given, the default shared client is used, which can be
+    tuned with `configure_default_client`.
+    """
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        _dispatch_overridden_verbs(cls, HTTPxClient)
+
+    def __init__(self, client: httpx.Client | None = None):
+        self._client = client
+        if client is not None and type(self).request is HTTPxClient.request:
+            # No default client to fall back to, so skip the wrapper on the hot path
+            self.request = client.request  # type: ignore [method-assign]
+
+    @property
+    def client(self) -> httpx.Client:
+        return self._client or _get_default_client()
 
-    def __init__(self, client: type[httpx.Client] | None = None):
-        self._client = client or httpx.Client()
+    def request(self, method: str, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return self.client.request(method, *args, **kwargs)
 
     def get(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.get(*args, **kwargs)
+        return self.client.get(*args, **kwargs)
 
     def options(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.options(*args, **kwargs)
+        return self.client.options(*args, **kwargs)
 
     def head(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.head(*args, **kwargs)
+        return self.client.head(*args, **kwargs)
 
     def post(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.post(*args, **kwargs)
+        return self.client.post(*args, **kwargs)
 
     def put(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.put(*args, **kwargs)
+        return self.client.put(*args, **kwargs)
 
     def patch(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.patch(*args, **kwargs)
+        return self.client.patch(*args, **kwargs)
 
     def delete(self, *args, **kwargs):  # type: ignore [no-untyped-def]
-        return self._client.delete(*args, **kwargs)
+        return self.client.delete(*args, **kwargs)
+
+
+class HTTPxAsyncClient(BaseHttpClient):
+    """
+    A thin wrapper around HTTPx's async client. This is the default client
+    used by `BaseApi.aexecute`.
+
+    Unless a client is given, a new one is opened and closed for each request,
+    using the settings given to `configure_default_client`, so no connections
+    are reused between requests. `BaseApi.gather` shares a single one between
+    all of its requests instead.
+    """
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        _dispatch_overridden_verbs(cls, HTTPxAsyncClient)
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        self._client = client
+        if client is not None and type(self).request is HTTPxAsyncClient.request:
+            # No default client to fall back to, so skip the wrapper on the hot path
+            self.request = client.request  # type: ignore [method-assign]
+
+    @property
+    def uses_default_client(self) -> bool:
+        return self._client is None
+
+    async def request(self, method: str, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request(method, *args, **kwargs)
+
+    async def _request(self, method: str, *args, **kwargs):  # type: ignore [no-untyped-def]
+        if self._client is not None:
+            return await self._client.request(method, *args, **kwargs)
+        async with _new_default_async_client() as client:
+            return await client.request(method, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("GET", *args, **kwargs)
+
+    async def options(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("OPTIONS", *args, **kwargs)
+
+    async def head(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("HEAD", *args, **kwargs)
+
+    async def post(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("POST", *args, **kwargs)
+
+    async def put(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("PUT", *args, **kwargs)
+
+    async def patch(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("PATCH", *args, **kwargs)
+
+    async def delete(self, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return await self._request("DELETE", *args, **kwargs)
 
 
 class RequestsClient(BaseHttpClient):
@@ -89,11 +221,23 @@ class RequestsClient(BaseHttpClient):
     or `poetry add quickapiclient[requests]`.
     """
 
-    def __init__(self, client: type["requests.sessions.Session"] | None = None):
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        _dispatch_overridden_verbs(cls, RequestsClient)
+
+    def __init__(self, client: "requests.sessions.Session | None" = None):
         if requests_installed is False:
             raise MissingDependencyError(dependency="requests")
 
+        import requests
+
         self._client = client or requests.sessions.Session()
+        if type(self).request is RequestsClient.request:
+            # Skip the wrapper on the hot path, `BaseApi` only ever calls `request`
+            self.request = self._client.request  # type: ignore [method-assign]
+
+    def request(self, method: str, *args, **kwargs):  # type: ignore [no-untyped-def]
+        return self._client.request(method, *args, **kwargs)
 
     def get(self, *args, **kwargs):  # type: ignore [no-untyped-def]
         return self._client.get(*args, **kwargs)
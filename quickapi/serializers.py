@@ -1,11 +1,26 @@
 import dataclasses
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Protocol, TypeAlias, TypeVar
+import functools
+import importlib.util
+import json
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Protocol,
+    TypeAlias,
+    TypeGuard,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 
 import attrs
 import cattrs
 
 if TYPE_CHECKING:
+    import pydantic
     from _typeshed import DataclassInstance
 
 from .exceptions import (
@@ -13,13 +28,56 @@ from .exceptions import (
     DictSerializationError,
 )
 
+# pydantic is only looked up and never imported here, as it's slow to import
+# and there can't be any pydantic models to convert before it's been imported.
+pydantic_installed = importlib.util.find_spec("pydantic") is not None
+
 try:
-    import pydantic
+    import orjson  # type: ignore [import-not-found, unused-ignore]
 except ImportError:
-    pydantic_installed = False
+    orjson_installed = False
 else:
-    pydantic_installed = True
+    orjson_installed = True
 
+try:
+    import msgspec  # type: ignore [import-not-found, unused-ignore]
+except ImportError:
+    msgspec_installed = False
+else:
+    msgspec_installed = True
+
+# Prefer the faster JSON parsers if they're installed. Depending on their version,
+# they can parse the integers that don't fit in 64 bits as floats, losing some
+# precision, which `json` never does.
+_json_loads: Callable[[str | bytes], Any]
+if orjson_installed:
+    _json_loads = orjson.loads
+elif msgspec_installed:
+    _json_loads = msgspec.json.decode
+else:
+    _json_loads = json.loads
+
+# What the JSON parsers raise for invalid JSON, both json's and orjson's errors
+# are a `ValueError`
+_JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if msgspec_installed:
+    _JSON_DECODE_ERRORS += (msgspec.DecodeError,)
+
+# A single converter shared by all the classes so that cattrs only has to build
+# the structure hook for any given class once. Detailed validation wraps every
+# field in its own try/except to collect all the errors, which isn't worth it
+# on the hot path as only the first one is needed to reject the values.
+_converter = cattrs.Converter(detailed_validation=False)
+
+# Same, but leaving out the fields that are still set to their default value
+_omit_defaults_converter = cattrs.Converter(
+    detailed_validation=False, omit_if_default=True
+)
+
+# The (un)structure hooks are looked up through the converters' private
+# `_structure_func/_unstructure_func` dispatchers, as the public
+# `get_(un)structure_hook` only exist from cattrs 24.1. That's only safe because
+# cattrs is pinned to `^23.2.3`, so it must be revisited when bumping it.
 
 DictSerializableT: TypeAlias = (
     "dict | DataclassInstance | attrs.AttrsInstance | pydantic.BaseModel"
@@ -38,16 +96,86 @@ class BaseSerializer(Protocol):
     ) -> FromDictSerializableT:
         raise NotImplementedError
 
+    @classmethod
+    def resolve_from_dict(
+        cls, klass: type[FromDictSerializableT]
+    ) -> Callable[[dict], FromDictSerializableT]:
+        raise NotImplementedError
+
+
+_structure_hooks: dict[type, Callable[[dict], Any]] = {}
+
+
+def _resolve_structure_hook(
+    klass: type[FromDictSerializableT],
+) -> Callable[[dict], FromDictSerializableT]:
+    """
+    Build a `from_dict` that calls the cattrs structure hook for `klass` directly.
+
+    The hook is the function cattrs generates specifically for `klass`, so this
+    also skips the converter's dispatch on every call. It's only built once per
+    class.
+    """
+    resolved_from_dict = _structure_hooks.get(klass)
+    if resolved_from_dict is not None:
+        return resolved_from_dict
+
+    structure_hook = _converter._structure_func.dispatch(klass)
+
+    def from_dict(values: dict) -> FromDictSerializableT:
+        # Without detailed validation, whatever a field's validator or converter
+        # raises comes out as is, so any error means the values were rejected
+        try:
+            return structure_hook(values, klass)  # type: ignore [no-any-return]
+        except Exception as e:
+            raise DictSerializationError(expected_type=klass.__name__) from e
+
+    _structure_hooks[klass] = from_dict
+    return from_dict
+
+
+def _is_pydantic_model(klass: object) -> "TypeGuard[type[pydantic.BaseModel]]":
+    pydantic = sys.modules.get("pydantic")
+    return (
+        pydantic is not None
+        and isinstance(klass, type)
+        and issubclass(klass, pydantic.BaseModel)
+    )
+
+
+def _has_no_fields(klass: type) -> bool:
+    """
+    Whether instances of `klass` always convert to an empty dict
+    (e.g. an empty default request body).
+    """
+    if dataclasses.is_dataclass(klass):
+        return not dataclasses.fields(klass)
+    if attrs.has(klass):
+        return not attrs.fields(klass)
+    if _is_pydantic_model(klass):
+        return not klass.model_fields and klass.model_config.get("extra") != "allow"
+    return False
+
 
 class BaseDeserializer(Protocol):
     @classmethod
     def can_apply(cls, instance: DictSerializableT) -> bool:
         raise NotImplementedError
 
+    @classmethod
+    def can_apply_to_class(cls, klass: type) -> bool:
+        raise NotImplementedError
+
     @classmethod
     def to_dict(cls, instance: DictSerializableT) -> dict | None:
         raise NotImplementedError
 
+    @classmethod
+    def resolve_to_dict(
+        cls, klass: type, omit_defaults: bool = False
+    ) -> Callable[[DictSerializableT], dict | None]:
+        raise NotImplementedError
+
 
 class DataclassSerializer:
     """
@@ -63,11 +191,14 @@ class DataclassSerializer:
     def from_dict(
         cls, klass: type[FromDictSerializableT], values: dict
     ) -> FromDictSerializableT:
-        try:
-            # TODO: See if there's a simpler approach so we can remove this hard dependency
-            return cattrs.structure(values, klass)
-        except cattrs.ClassValidationError as e:
-            raise DictSerializationError(expected_type=klass.__name__) from e
+        # TODO: See if there's a simpler approach so we can remove this hard dependency
+        return _resolve_structure_hook(klass)(values)
+
+    @classmethod
+    def resolve_from_dict(
+        cls, klass: type[FromDictSerializableT]
+    ) -> Callable[[dict], FromDictSerializableT]:
+        return _resolve_structure_hook(klass)
 
 
 class DataclassDeserializer:
@@ -79,9 +210,22 @@ class DataclassDeserializer:
     def can_apply(cls, instance: "DataclassInstance") -> bool:
         return dataclasses.is_dataclass(instance)
 
+    @classmethod
+    def can_apply_to_class(cls, klass: type) -> bool:
+        return dataclasses.is_dataclass(klass)
+
     @classmethod
     def to_dict(cls, instance: "DataclassInstance") -> dict | None:
-        return dataclasses.asdict(instance)
+        # Same as for attrs, as `dataclasses.asdict` also deep copies every value
+        values: dict = _converter.unstructure(instance)
+        return values
+
+    @classmethod
+    def resolve_to_dict(
+        cls, klass: type, omit_defaults: bool = False
+    ) -> Callable[["DataclassInstance"], dict | None]:
+        converter = _omit_defaults_converter if omit_defaults else _converter
+        return converter._unstructure_func.dispatch(klass)
 
 
 class AttrsSerializer:
@@ -98,10 +242,13 @@ class AttrsSerializer:
     def from_dict(
         cls, klass: type[FromDictSerializableT], values: dict
     ) -> FromDictSerializableT:
-        try:
-            return cattrs.structure(values, klass)
-        except cattrs.ClassValidationError as e:
-            raise DictSerializationError(expected_type=klass.__name__) from e
+        return _resolve_structure_hook(klass)(values)
+
+    @classmethod
+    def resolve_from_dict(
+        cls, klass: type[FromDictSerializableT]
+    ) -> Callable[[dict], FromDictSerializableT]:
+        return _resolve_structure_hook(klass)
 
 
 class AttrsDeserializer:
@@ -113,9 +260,23 @@ class AttrsDeserializer:
     def can_apply(cls, instance: "attrs.AttrsInstance") -> bool:
         return attrs.has(type(instance))
 
+    @classmethod
+    def can_apply_to_class(cls, klass: type) -> bool:
+        return attrs.has(klass)
+
     @classmethod
     def to_dict(cls, instance: "attrs.AttrsInstance") -> dict | None:
-        return attrs.asdict(instance)
+        # cattrs generates (and caches) a straight-line unstructure function per
+        # class, which is a lot cheaper than `attrs.asdict` walking the fields
+        values: dict = _converter.unstructure(instance)
+        return values
+
+    @classmethod
+    def resolve_to_dict(
+        cls, klass: type, omit_defaults: bool = False
+    ) -> Callable[["attrs.AttrsInstance"], dict | None]:
+        converter = _omit_defaults_converter if omit_defaults else _converter
+        return converter._unstructure_func.dispatch(klass)
 
 
 class PydanticSerializer:
@@ -125,30 +286,100 @@ class PydanticSerializer:
 
     @classmethod
     def can_apply(cls, klass: type[FromDictSerializableT]) -> bool:
-        # TODO: Is this correct?
-        return pydantic_installed and issubclass(klass, pydantic.BaseModel)
+        return _is_pydantic_model(klass)
 
     @classmethod
     def from_dict(
         cls, klass: type[FromDictSerializableT], values: dict
     ) -> FromDictSerializableT:
+        import pydantic
+
         try:
-            return klass(**values)
+            # Validates the dict as is in pydantic-core, without unpacking it
+            # into keyword arguments first
+            return klass.model_validate(values)  # type: ignore [attr-defined, no-any-return]
         except pydantic.ValidationError as e:
             raise DictSerializationError(expected_type=klass.__name__) from e
 
+    @classmethod
+    def resolve_from_dict(
+        cls, klass: type[FromDictSerializableT]
+    ) -> Callable[[dict], FromDictSerializableT]:
+        from pydantic import ValidationError
+
+        # Call the model's prebuilt validator directly, unless the model isn't
+        # complete yet (e.g. pending forward references) and still needs to be
+        # rebuilt by `model_validate` first
+        validate = (
+            klass.__pydantic_validator__.validate_python  # type: ignore [attr-defined]
+            if klass.__pydantic_complete__  # type: ignore [attr-defined]
+            else klass.model_validate  # type: ignore [attr-defined]
+        )
+
+        def from_dict(values: dict) -> FromDictSerializableT:
+            try:
+                return validate(values)  # type: ignore [no-any-return]
+            except ValidationError as e:
+                raise DictSerializationError(expected_type=klass.__name__) from e
+
+        return from_dict
+
 
 class PydanticDeserializer:
     """Convert from pydantic model to dict."""
 
     @classmethod
     def can_apply(cls, instance: "pydantic.BaseModel") -> bool:
-        return pydantic_installed and isinstance(instance, pydantic.BaseModel)
+        return _is_pydantic_model(type(instance))
+
+    @classmethod
+    def can_apply_to_class(cls, klass: type) -> bool:
+        return _is_pydantic_model(klass)
 
     @classmethod
     def to_dict(cls, instance: "pydantic.BaseModel") -> dict | None:
         return instance.model_dump()
 
+    @classmethod
+    def resolve_to_dict(
+        cls, klass: type, omit_defaults: bool = False
+    ) -> Callable[["pydantic.BaseModel"], dict | None]:
+        if not klass.__pydantic_complete__:  # type: ignore [attr-defined]
+            if omit_defaults:
+                return functools.partial(klass.model_dump, exclude_defaults=True)  # type: ignore [attr-defined]
+            return cls.to_dict
+
+        # Same as `model_dump`, but calling the model's prebuilt serializer directly
+        return functools.partial(
+            klass.__pydantic_serializer__.to_python,  # type: ignore [attr-defined]
+            by_alias=False,
+            exclude_defaults=omit_defaults,
+        )
+
+
+CACHE_MAXSIZE = 256
+
+
+def _parse_json(values_json: str | bytes, expected_type: str) -> Any:
+    try:
+        return _json_loads(values_json)
+    except _JSON_DECODE_ERRORS:
+        pass
+
+    # The faster parsers are stricter, while `json` also accepts a BOM, UTF-16/32
+    # without a charset and `NaN`/`Infinity`, same as `httpx.Response.json()`
+    try:
+        return json.loads(values_json)
+    except ValueError as e:
+        raise DictSerializationError(expected_type=expected_type) from e
+
+
+@functools.lru_cache(maxsize=CACHE_MAXSIZE)
+def _cached_from_json(
+    from_dict: Callable[[dict], object], values_json: str | bytes, expected_type: str
+) -> object:
+    return from_dict(_parse_json(values_json, expected_type))
+
 
 class DictSerializable:
     """
@@ -169,18 +400,196 @@ class DictSerializable:
         PydanticDeserializer,
     )
 
+    # Which (de)serializer applies to each class, so it's only checked once
+    _serializer_cache: ClassVar[dict[type, type[BaseSerializer] | None]] = {}
+    _deserializer_cache: ClassVar[dict[type, type[BaseDeserializer] | None]] = {}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        # A subclass can configure other (de)serializers, so it can't share these
+        super().__init_subclass__(**kwargs)
+        cls._serializer_cache = {}
+        cls._deserializer_cache = {}
+
     @classmethod
     def from_dict(
         cls, klass: type[FromDictSerializableT], values: dict
     ) -> FromDictSerializableT:
-        for serializer in cls.serializers:
-            if serializer.can_apply(klass):
-                return serializer.from_dict(klass, values)
-        raise DictSerializationError(expected_type=klass.__name__)
+        if get_origin(klass) is list:
+            # e.g. `list[ResponseBody]`, converted the same way as when resolved
+            return cls.resolve_from_dict(klass)(values)
+        serializer = cls._get_serializer(klass)
+        if serializer is None:
+            raise DictSerializationError(expected_type=klass.__name__)
+        # Already converted, e.g. when an instance is reused as is. The origin
+        # is checked for generic aliases such as `Model[int]`
+        if isinstance(values, get_origin(klass) or klass):
+            return values
+        return serializer.from_dict(klass, values)
+
+    @classmethod
+    def from_dict_many(
+        cls, klass: type[FromDictSerializableT], values: Iterable[dict]
+    ) -> list[FromDictSerializableT]:
+        """
+        Convert each of `values` to `klass`, resolving the serializer only once.
+
+        Unlike `from_dict`, the values must all be dicts, as they are passed
+        straight to the resolved serializer.
+        """
+        return list(map(cls.resolve_from_dict(klass), values))
 
     @classmethod
     def to_dict(cls, instance: DictSerializableT) -> dict | None:
+        # Plain dicts are passed through as they are, there's nothing to convert
+        if isinstance(instance, dict):
+            return instance
+        klass = type(instance)
+        try:
+            deserializer = cls._deserializer_cache[klass]
+        except KeyError:
+            deserializer = cls._deserializer_cache[klass] = next(
+                (d for d in cls.deserializers if d.can_apply(instance)), None
+            )
+        if deserializer is None:
+            raise DictDeserializationError(expected_type=str(DictSerializableT))
+        return deserializer.to_dict(instance)
+
+    @classmethod
+    def _get_serializer(cls, klass: type) -> type[BaseSerializer] | None:
+        try:
+            return cls._serializer_cache[klass]
+        except KeyError:
+            serializer = cls._serializer_cache[klass] = next(
+                (s for s in cls.serializers if s.can_apply(klass)), None
+            )
+            return serializer
+
+    @classmethod
+    def resolve_from_dict(
+        cls, klass: type[FromDictSerializableT], cached: bool = False
+    ) -> Callable[[dict], FromDictSerializableT]:
+        """
+        Resolve the serializer for `klass` once and return a `from_dict` bound to it.
+
+        Useful when the same class is converted over and over, as it skips
+        checking which serializer can apply on every call.
+
+        If `cached` is set, the same instance is returned again for the same
+        values (up to `CACHE_MAXSIZE` of them), so it should be treated as
+        read-only. See `cache_clear` to reset it.
+        """
+        resolved_from_dict: Callable[[dict], FromDictSerializableT]
+        if get_origin(klass) is list:
+            # e.g. `list[ResponseBody]`, all the items share the same `from_dict`
+            (item_klass,) = get_args(klass)
+            item_from_dict = cls.resolve_from_dict(item_klass)
+
+            def from_dict_many(values: Any) -> FromDictSerializableT:
+                if not isinstance(values, list):
+                    raise DictSerializationError(expected_type=str(klass))
+                return list(map(item_from_dict, values))  # type: ignore [return-value]
+
+            resolved_from_dict = from_dict_many
+        else:
+            serializer = cls._get_serializer(klass)
+            resolved_from_dict = (
+                serializer.resolve_from_dict(klass)
+                if serializer is not None
+                else functools.partial(cls.from_dict, klass)
+            )
+
+        if not cached:
+            return resolved_from_dict
+
+        def cached_from_dict(values: dict) -> FromDictSerializableT:
+            return _cached_from_json(  # type: ignore [return-value]
+                resolved_from_dict,
+                json.dumps(values, sort_keys=True),
+                klass.__name__,
+            )
+
+        return cached_from_dict
+
+    @classmethod
+    def resolve_from_json(
+        cls, klass: type[FromDictSerializableT], cached: bool = False
+    ) -> Callable[[bytes], FromDictSerializableT]:
+        """
+        Same as `resolve_from_dict`, but converting straight from the JSON.
+
+        If `cached` is set, the raw JSON is used as the cache key, so a cache hit
+        skips parsing it too.
+        """
+        resolved_from_dict = cls.resolve_from_dict(klass)
+
+        if cached:
+
+            def cached_from_json(content: bytes) -> FromDictSerializableT:
+                return _cached_from_json(  # type: ignore [return-value]
+                    resolved_from_dict, content, klass.__name__
+                )
+
+            return cached_from_json
+
+        def from_json(content: bytes) -> FromDictSerializableT:
+            return resolved_from_dict(_parse_json(content, klass.__name__))
+
+        return from_json
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear the instances cached by `resolve_from_dict/resolve_from_json`."""
+        _cached_from_json.cache_clear()
+
+    @classmethod
+    def resolve_to_dict(
+        cls, klass: type, omit_defaults: bool = False
+    ) -> Callable[[DictSerializableT], dict | None]:
+        """
+        Resolve the deserializer for instances of `klass` once and return its `to_dict`.
+
+        Instances of any other type are still converted through `to_dict`.
+        If `klass` has no fields, the dict converted for the last instance is
+        returned again for that same instance, so it shouldn't be modified.
+
+        If `omit_defaults` is set, the fields of `klass` instances that are
+        still set to their default value are left out of the dict.
+        """
         for deserializer in cls.deserializers:
-            if deserializer.can_apply(instance):
-                return deserializer.to_dict(instance)
-        raise DictDeserializationError(expected_type=str(DictSerializableT))
+            try:
+                applies = deserializer.can_apply_to_class(klass)
+            except (AttributeError, NotImplementedError):
+                # Can only be checked per instance, e.g. a custom deserializer
+                # that only implements `can_apply` and `to_dict`
+                return cls.to_dict
+            if applies:
+                resolved_to_dict = (
+                    deserializer.resolve_to_dict(klass, omit_defaults=True)
+                    if omit_defaults
+                    else deserializer.resolve_to_dict(klass)
+                )
+                break
+        else:
+            return cls.to_dict
+
+        def to_dict(instance: DictSerializableT) -> dict | None:
+            if type(instance) is klass:
+                return resolved_to_dict(instance)
+            return cls.to_dict(instance)
+
+        if not _has_no_fields(klass):
+            return to_dict
+
+        # Even frozen instances can hold mutable fields, so only the instances
+        # without any fields are known to always convert to the same dict
+        last_instance: DictSerializableT | None = None
+        last_values: dict | None = None
+
+        def memoized_to_dict(instance: DictSerializableT) -> dict | None:
+            nonlocal last_instance, last_values
+            if instance is not last_instance:
+                last_values = to_dict(instance)
+                last_instance = instance
+            return last_values
+
+        return memoized_to_dict
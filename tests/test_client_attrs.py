@@ -1,3 +1,4 @@
+import asyncio
 from base64 import b64encode
 
 import attrs
@@ -40,6 +41,43 @@ class GetApi(quickapi.BaseApi[ResponseBody]):
     response_body = ResponseBody
 
 
+@attrs.define
+class ForwardRefRequestParams:
+    later: "LaterRequestParams | None" = None
+
+
+@attrs.define
+class ForwardRefResponseBody:
+    data: "list[LaterFact]"
+
+
+class ForwardRefGetApi(quickapi.BaseApi[ForwardRefResponseBody]):
+    url = "https://example.com/facts"
+    request_params = ForwardRefRequestParams
+    response_body = ForwardRefResponseBody
+
+
+# Only defined once the API above already is
+@attrs.define
+class LaterRequestParams:
+    limit: int = 10
+
+
+@attrs.define
+class LaterFact:
+    fact: str
+
+
+class TestForwardRefGetApi:
+    def test_api_call(self, httpx_mock: HTTPXMock):
+        mock_json = {"data": [{"fact": "Some fact"}]}
+        httpx_mock.add_response(json=mock_json)
+
+        client = ForwardRefGetApi()
+        response = client.execute()
+        assert response.body == ForwardRefResponseBody(data=[LaterFact("Some fact")])
+
+
 class TestGetApi:
     def test_api_call(self, httpx_mock: HTTPXMock):
         mock_json = {"current_page": 1, "data": [{"fact": "Some fact", "length": 9}]}
@@ -50,6 +88,37 @@ class TestGetApi:
         assert response.body == cattrs.structure(mock_json, ResponseBody)
         assert response.body.data[0] == Fact(fact="Some fact", length=9)
 
+    def test_api_call_body_only(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": [{"fact": "Some fact", "length": 9}]}
+        httpx_mock.add_response(json=mock_json)
+
+        client = GetApi()
+        body = client.execute_body()
+        assert body == cattrs.structure(mock_json, ResponseBody)
+
+    def test_api_call_raw(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=500, content=b"Not JSON")
+
+        client = GetApi()
+        client_response = client.execute_raw()
+        assert client_response.status_code == 500
+        assert client_response.content == b"Not JSON"
+
+
+class GetListApi(quickapi.BaseApi[list[Fact]]):
+    url = "https://example.com/facts/all"
+    response_body = list[Fact]
+
+
+class TestGetListApi:
+    def test_api_call(self, httpx_mock: HTTPXMock):
+        mock_json = [{"fact": "Some fact", "length": 9}, {"fact": "Fact", "length": 4}]
+        httpx_mock.add_response(json=mock_json)
+
+        client = GetListApi()
+        response = client.execute()
+        assert response.body == [Fact(fact="Some fact", length=9), Fact("Fact", 4)]
+
 
 class GetApiRequestsClient(GetApi):
     http_client = quickapi.RequestsClient()
@@ -90,6 +159,19 @@ class TestGetWithParamsApi:
         response = client.execute()
         assert response.body == cattrs.structure(mock_json, ResponseBody)
 
+    def test_default_request_params_not_shared(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=f"{GetWithParamsApi.url}?max_length={RequestParams().max_length}&limit={RequestParams().limit}",
+                json=mock_json,
+            )
+
+        client = GetWithParamsApi()
+        client.execute()
+        client._request_params.limit = 1
+        GetWithParamsApi().execute()
+
     def test_api_call_with_custom_request_params(self, httpx_mock: HTTPXMock):
         mock_json = {"current_page": 1, "data": [{"fact": "fact", "length": 4}]}
         request_params = RequestParams(max_length=5, limit=10)
@@ -133,6 +215,12 @@ class TestHeadApi:
         assert response.body == cattrs.structure(mock_json, ResponseBody)
         assert response.body.data[0] == Fact(fact="Some fact", length=9)
 
+    def test_api_call_without_content(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(method=HeadApi.method)
+
+        client = HeadApi()
+        assert client.execute().body is None
+
 
 class DeleteApi(GetApi):
     method = quickapi.BaseApiMethod.DELETE
@@ -149,6 +237,158 @@ class TestDeleteApi:
         assert response.body.data[0] == Fact(fact="Some fact", length=9)
 
 
+class TestAsyncGetApi:
+    def test_api_call(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": [{"fact": "Some fact", "length": 9}]}
+        httpx_mock.add_response(json=mock_json)
+
+        client = GetApi()
+        response = asyncio.run(client.aexecute())
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+        assert response.body.data[0] == Fact(fact="Some fact", length=9)
+
+    def test_api_call_with_custom_request_params(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": [{"fact": "fact", "length": 4}]}
+        request_params = RequestParams(max_length=5, limit=10)
+        httpx_mock.add_response(
+            url=f"{GetWithParamsApi.url}?max_length={request_params.max_length}&limit={request_params.limit}",
+            json=mock_json,
+        )
+
+        client = GetWithParamsApi()
+        response = asyncio.run(client.aexecute(request_params=request_params))
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+    def test_gather_api_calls(self, httpx_mock: HTTPXMock):
+        mock_jsons = [
+            {"current_page": page, "data": [{"fact": "Some fact", "length": 9}]}
+            for page in range(1, 4)
+        ]
+        for mock_json in mock_jsons:
+            httpx_mock.add_response(json=mock_json)
+
+        api_responses = asyncio.run(
+            quickapi.BaseApi.gather([GetApi() for _ in mock_jsons])
+        )
+        assert sorted(response.body.current_page for response in api_responses) == [
+            1,
+            2,
+            3,
+        ]
+
+
+class CachedGetWithParamsApi(GetWithParamsApi):
+    enable_http_cache = True
+
+
+class TestCachedGetWithParamsApi:
+    def test_api_call_not_modified(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": [{"fact": "Some fact", "length": 9}]}
+        httpx_mock.add_response(json=mock_json, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(
+            match_headers={"If-None-Match": '"v1"'}, status_code=304
+        )
+
+        client = CachedGetWithParamsApi()
+        response = client.execute()
+        assert client.execute() is response
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+    def test_api_call_modified(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        new_mock_json = {"current_page": 2, "data": []}
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        httpx_mock.add_response(
+            json=mock_json, headers={"Last-Modified": last_modified}
+        )
+        httpx_mock.add_response(
+            match_headers={"If-Modified-Since": last_modified}, json=new_mock_json
+        )
+
+        client = CachedGetWithParamsApi()
+        client.execute()
+        response = client.execute()
+        assert response.body == cattrs.structure(new_mock_json, ResponseBody)
+
+    def test_api_call_with_other_request_params(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(json=mock_json, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(json=mock_json)
+
+        client = CachedGetWithParamsApi()
+        client.execute()
+        client.execute(request_params=RequestParams(max_length=5))
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
+    def test_api_call_not_modified_after_invalid_response(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(json=mock_json, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(json={"data": []}, headers={"ETag": '"v2"'})
+        httpx_mock.add_response(json=mock_json)
+
+        client = CachedGetWithParamsApi()
+        client.execute()
+        with pytest.raises(quickapi.ResponseSerializationError):
+            client.execute()
+        client.execute()
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
+    def test_api_call_with_changed_dict_request_params(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(json=mock_json, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(json=mock_json)
+
+        client = CachedGetWithParamsApi()
+        request_params = {"max_length": 5}
+        client.execute(request_params=request_params)
+        request_params["max_length"] = 6
+        client.execute(request_params=request_params)
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
+    def test_api_call_not_modified_without_http_cache(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(json=mock_json, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(status_code=304)
+
+        client = GetWithParamsApi()
+        client.execute()
+        with pytest.raises(quickapi.HTTPError):
+            client.execute()
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
+
+class OmitDefaultsGetWithParamsApi(GetWithParamsApi):
+    omit_request_defaults = True
+
+
+class TestOmitDefaultsGetWithParamsApi:
+    def test_api_call_without_default_request_params(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(
+            url=f"{OmitDefaultsGetWithParamsApi.url}?limit=5", json=mock_json
+        )
+
+        client = OmitDefaultsGetWithParamsApi()
+        response = client.execute(request_params=RequestParams(limit=5))
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+
+class CachedResponseBodyApi(GetApi):
+    cache_response_body = True
+
+
+class TestCachedResponseBodyApi:
+    def test_api_call_with_same_response(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": [{"fact": "Some fact", "length": 9}]}
+        httpx_mock.add_response(json=mock_json)
+        httpx_mock.add_response(json=mock_json)
+
+        client = CachedResponseBodyApi()
+        body = client.execute().body
+        assert client.execute().body is body
+        assert body == cattrs.structure(mock_json, ResponseBody)
+
+
 class PostApi(quickapi.BaseApi[ResponseBody]):
     url = "https://example.com/facts"
     method = quickapi.BaseApiMethod.POST
@@ -186,6 +426,61 @@ class TestPostApi:
         assert response.body == cattrs.structure(mock_json, ResponseBody)
 
 
+class PlainMethodPostApi(PostApi):
+    method = "POST"  # pyright: ignore [reportAssignmentType]
+
+
+class TestPlainMethodPostApi:
+    def test_api_call_with_request_body(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(method="POST", json=mock_json)
+
+        client = PlainMethodPostApi()
+        response = client.execute(request_body=RequestBody(some_data="Test body"))
+        assert PlainMethodPostApi.method is quickapi.BaseApiMethod.POST
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+
+class TestAsyncPostApi:
+    def test_api_call_with_request_body(self, httpx_mock: HTTPXMock):
+        mock_json = {
+            "current_page": 1,
+            "data": [{"fact": "Some other fact", "length": 16}],
+        }
+        request_body = RequestBody(some_data="Test body")
+        httpx_mock.add_response(
+            method=PostApi.method,
+            match_json=quickapi.DictSerializable.to_dict(request_body),
+            json=mock_json,
+        )
+        client = PostApi()
+        response = asyncio.run(client.aexecute(request_body=request_body))
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+
+@attrs.define
+class RequiredRequestBody:
+    some_data: str
+
+
+class PostRequiredBodyApi(PostApi):
+    request_body = RequiredRequestBody
+
+
+class TestPostRequiredBodyApi:
+    def test_api_call_with_request_body(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        request_body = RequiredRequestBody(some_data="Test body")
+        httpx_mock.add_response(
+            method=PostRequiredBodyApi.method,
+            match_json=quickapi.DictSerializable.to_dict(request_body),
+            json=mock_json,
+        )
+        client = PostRequiredBodyApi()
+        response = client.execute(request_body=request_body)
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+
 class PostApiRequestsClient(PostApi):
     http_client = quickapi.RequestsClient()
 
@@ -235,6 +530,51 @@ class TestPostApiRequestsClient:
         assert response.body.data[0] == Fact(fact="Some other fact", length=16)
 
 
+class CreatePostApi(PostApi):
+    ok_status_codes = frozenset({200, 201})
+
+
+class TestCreatePostApi:
+    def test_api_call_with_accepted_status_code(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": []}
+        httpx_mock.add_response(status_code=201, json=mock_json)
+
+        client = CreatePostApi()
+        response = client.execute(request_body=RequestBody(some_data="Test body"))
+        assert response.body == cattrs.structure(mock_json, ResponseBody)
+
+    def test_api_call_with_unexpected_status_code(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=202)
+
+        client = CreatePostApi()
+        with pytest.raises(quickapi.HTTPError) as e:
+            client.execute(request_body=RequestBody(some_data="Test body"))
+        assert e.value.status_code == 202
+        assert "`202`" in str(e.value)
+
+
+class NoContentDeleteApi(GetApi):
+    method = quickapi.BaseApiMethod.DELETE
+    ok_status_codes = frozenset({200, 204})
+
+
+class TestNoContentDeleteApi:
+    def test_api_call_with_no_content(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(method=NoContentDeleteApi.method, status_code=204)
+
+        client = NoContentDeleteApi()
+        response = client.execute()
+        assert response.client_response.status_code == 204
+        assert response.body is None
+
+    def test_api_call_with_empty_content(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(method=NoContentDeleteApi.method, status_code=200)
+
+        client = NoContentDeleteApi()
+        with pytest.raises(quickapi.ResponseSerializationError):
+            client.execute()
+
+
 class PutApi(PostApi):
     method = quickapi.BaseApiMethod.PUT
 
@@ -402,6 +742,16 @@ class TestClientSetupError:
                 http_client = object()  # pyright: ignore [reportAssignmentType]
                 response_body = ResponseBody
 
+    def test_should_raise_error_if_invalid_async_http_client(
+        self, httpx_mock: HTTPXMock
+    ):
+        with pytest.raises(quickapi.ClientSetupError):
+
+            class _(quickapi.BaseApi[ResponseBody]):
+                url = "https://example.com/facts"
+                async_http_client = object()  # pyright: ignore [reportAssignmentType]
+                response_body = ResponseBody
+
 
 class TestSerializationError:
     def test_error_if_response_body_attribute_incorrect_type(
@@ -428,6 +778,13 @@ class TestSerializationError:
             client = GetApi()
             client.execute()
 
+    def test_error_if_response_body_invalid_json(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(content=b"<html></html>")
+
+        with pytest.raises(quickapi.ResponseSerializationError):
+            client = GetApi()
+            client.execute()
+
     def test_response_body_validator(self, httpx_mock: HTTPXMock):
         mock_json_validator_fail = {"current_page": 101}
         httpx_mock.add_response(
@@ -79,3 +79,15 @@ class TestGetDataclassApi:
         )
         assert response.body.current_page == 1
         assert response.body.data[0] == Fact(fact="fact", length=4)
+
+    def test_api_call_with_dict_request_params(self, httpx_mock: HTTPXMock):
+        mock_json = {"current_page": 1, "data": [{"fact": "fact", "length": 4}]}
+        request_params = {"max_length": 5, "limit": 10}
+        httpx_mock.add_response(
+            url=f"{PostDataclassApi.url}?max_length=5&limit=10",
+            json=mock_json,
+        )
+
+        client = PostDataclassApi()
+        response = client.execute(request_params=request_params)
+        assert response.body.data[0] == Fact(fact="fact", length=4)
@@ -0,0 +1,170 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import responses
+from pytest_httpx import HTTPXMock
+
+import quickapi
+from quickapi import http_client
+
+
+class TestHTTPxClient:
+    def test_default_client_is_shared(self):
+        assert quickapi.HTTPxClient().client is quickapi.HTTPxClient().client
+
+    def test_default_client_is_created_once(self, monkeypatch):
+        monkeypatch.setattr(http_client, "_default_client", None)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = set(
+                executor.map(lambda _: quickapi.HTTPxClient().client, range(8))
+            )
+        assert len(clients) == 1
+
+    def test_custom_client_is_used(self):
+        client = httpx.Client()
+        assert quickapi.HTTPxClient(client).client is client
+
+    def test_custom_client_request_is_not_wrapped(self):
+        client = httpx.Client()
+        assert quickapi.HTTPxClient(client).request == client.request
+
+    def test_configure_default_client(self):
+        client = quickapi.HTTPxClient()
+        previous_default_client = client.client
+        timeout = httpx.Timeout(1.0)
+
+        quickapi.configure_default_client(timeout=timeout)
+        try:
+            assert client.client is not previous_default_client
+            assert client.client.timeout == timeout
+        finally:
+            quickapi.configure_default_client()
+
+        assert client.client.timeout == http_client.DEFAULT_TIMEOUT
+
+
+class GetOnlyHTTPxClient(quickapi.HTTPxClient):
+    def __init__(self, client=None):
+        super().__init__(client)
+        self.calls = []
+
+    def get(self, *args, **kwargs):
+        self.calls.append("get")
+        return super().get(*args, **kwargs)
+
+
+class TestHTTPxClientSubclass:
+    @pytest.mark.parametrize("client", [None, httpx.Client()])
+    def test_request_uses_overridden_method(self, httpx_mock: HTTPXMock, client):
+        httpx_mock.add_response(url="https://example.com")
+
+        http_client = GetOnlyHTTPxClient(client)
+        http_client.request("GET", url="https://example.com")
+        assert http_client.calls == ["get"]
+
+    def test_custom_client_request_is_not_wrapped_without_overrides(self):
+        class OtherHTTPxClient(quickapi.HTTPxClient):
+            pass
+
+        client = httpx.Client()
+        assert OtherHTTPxClient(client).request == client.request
+
+
+class GetOnlyHTTPxAsyncClient(quickapi.HTTPxAsyncClient):
+    def __init__(self, client=None):
+        super().__init__(client)
+        self.calls = []
+
+    async def get(self, *args, **kwargs):
+        self.calls.append("get")
+        return await super().get(*args, **kwargs)
+
+
+class GetOnlyRequestsClient(quickapi.RequestsClient):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def get(self, *args, **kwargs):
+        self.calls.append("get")
+        return super().get(*args, **kwargs)
+
+
+class TestRequestsClientSubclass:
+    @responses.activate
+    def test_request_uses_overridden_method(self):
+        responses.add(method="GET", url="https://example.com")
+
+        http_client = GetOnlyRequestsClient()
+        http_client.request("GET", url="https://example.com")
+        assert http_client.calls == ["get"]
+
+
+class TestHTTPxAsyncClient:
+    def test_custom_client_request_is_not_wrapped(self):
+        client = httpx.AsyncClient()
+        assert quickapi.HTTPxAsyncClient(client).request == client.request
+
+    def test_request_uses_overridden_method(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url="https://example.com")
+
+        http_client = GetOnlyHTTPxAsyncClient()
+        asyncio.run(http_client.request("GET", url="https://example.com"))
+        assert http_client.calls == ["get"]
+
+    def test_default_client_across_event_loops(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url="https://example.com", json={})
+        httpx_mock.add_response(url="https://example.com", json={})
+
+        client = quickapi.HTTPxAsyncClient()
+        for _ in range(2):
+            response = asyncio.run(client.get(url="https://example.com"))
+            assert response.status_code == 200
+
+
+class VerbOnlyClient(quickapi.BaseHttpClient):
+    def __init__(self):
+        self.calls = []
+
+    def _send(self, method, **kwargs):
+        self.calls.append((method, kwargs["url"]))
+        return method
+
+    def get(self, *args, **kwargs):
+        return self._send("get", **kwargs)
+
+    def options(self, *args, **kwargs):
+        return self._send("options", **kwargs)
+
+    def head(self, *args, **kwargs):
+        return self._send("head", **kwargs)
+
+    def post(self, *args, **kwargs):
+        return self._send("post", **kwargs)
+
+    def put(self, *args, **kwargs):
+        return self._send("put", **kwargs)
+
+    def patch(self, *args, **kwargs):
+        return self._send("patch", **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._send("delete", **kwargs)
+
+
+class TestBaseHttpClient:
+    def test_request_uses_method_specific_implementation(self):
+        client = VerbOnlyClient()
+        assert client.request("POST", url="https://example.com") == "post"
+        assert client.calls == [("post", "https://example.com")]
+
+    def test_client_without_subclassing_is_accepted(self):
+        class StructuralClient:
+            request = get = options = head = post = put = patch = delete = (
+                VerbOnlyClient._send
+            )
+
+        assert isinstance(StructuralClient(), quickapi.BaseHttpClient)
+        assert not isinstance(object(), quickapi.BaseHttpClient)
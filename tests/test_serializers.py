@@ -1,24 +1,34 @@
 import dataclasses
-from typing import ClassVar
+from functools import partial
+from typing import ClassVar, Generic, TypeVar
 
 import attrs
 import pydantic
 import pytest
 
+from quickapi import serializers
 from quickapi.exceptions import (
     DictDeserializationError,
     DictSerializationError,
 )
-from quickapi.serializers import DictSerializable
+from quickapi.serializers import (
+    AttrsDeserializer,
+    AttrsSerializer,
+    DataclassDeserializer,
+    DictSerializable,
+    PydanticDeserializer,
+)
 
+T = TypeVar("T")
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class DataclassFact:
     fact: str
     length: int
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DataclassComplexModel:
     current_page: int
     data: list[DataclassFact] = dataclasses.field(default_factory=list)
@@ -36,6 +46,48 @@ class AttrsComplexModel:
     data: list[AttrsFact] = attrs.field(factory=list)
 
 
+class CustomValidationError(Exception):
+    pass
+
+
+def reject(instance, attribute, value):
+    raise CustomValidationError
+
+
+@attrs.define
+class AttrsRejectedFact:
+    fact: str = attrs.field(validator=reject)
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenDataclassFacts:
+    facts: list[str]
+
+
+@attrs.frozen
+class FrozenAttrsFacts:
+    facts: list[str]
+
+
+@dataclasses.dataclass
+class DataclassEmpty:
+    pass
+
+
+@attrs.define
+class AttrsEmpty:
+    pass
+
+
+class PydanticEmpty(pydantic.BaseModel):
+    pass
+
+
+@attrs.define
+class AttrsGenericModel(Generic[T]):
+    value: T
+
+
 class PydanticFact(pydantic.BaseModel):
     fact: str
     length: int
@@ -51,56 +103,250 @@ class TestSimpleSerializers:
     complex_model: ClassVar = {"current_page": 1, "data": [simple_model]}
     invalid_model: ClassVar = {"current_page": "not_int", "data": []}
 
-    @pytest.mark.parametrize(
-        "input_data",
-        [
-            DataclassFact(**simple_model),
-            AttrsFact(**simple_model),
-            PydanticFact(**simple_model),
+    # Built once per class, these are only read by the tests using them
+    @pytest.fixture(
+        scope="class",
+        params=[
+            (DataclassFact, DataclassComplexModel),
+            (AttrsFact, AttrsComplexModel),
+            (PydanticFact, PydanticComplexModel),
         ],
+        ids=["dataclass", "attrs", "pydantic"],
     )
-    def test_to_and_from_simple_model(self, input_data):
-        assert DictSerializable.to_dict(input_data) == self.simple_model
+    def models(self, request):
+        return request.param
+
+    @pytest.fixture(scope="class")
+    def simple_instance(self, models):
+        fact, _ = models
+        return fact(**self.simple_model)
+
+    @pytest.fixture(scope="class")
+    def complex_instance(self, models):
+        fact, model = models
+        return model(current_page=1, data=[fact(**self.simple_model)])
+
+    @pytest.mark.parametrize("kind", ["simple", "complex"])
+    def test_to_and_from_model(self, kind, simple_instance, complex_instance):
+        input_data, expected = {
+            "simple": (simple_instance, self.simple_model),
+            "complex": (complex_instance, self.complex_model),
+        }[kind]
+        assert DictSerializable.to_dict(input_data) == expected
+        assert DictSerializable.from_dict(type(input_data), expected) == input_data
+
+    def test_from_dict_with_instance(self, simple_instance):
         assert (
-            DictSerializable.from_dict(type(input_data), self.simple_model)
-            == input_data
+            DictSerializable.from_dict(type(simple_instance), simple_instance)
+            is simple_instance
         )
 
+    def test_from_dict_with_generic_model(self):
+        instance = DictSerializable.from_dict(AttrsGenericModel[int], {"value": 1})
+        assert instance == AttrsGenericModel(value=1)
+        assert DictSerializable.from_dict(AttrsGenericModel[int], instance) is instance
+
+    @pytest.mark.parametrize("klass", [DataclassFact, AttrsFact, PydanticFact])
+    def test_from_dict_many(self, klass):
+        values = [self.simple_model, {"fact": "other fact", "length": 10}]
+        assert DictSerializable.from_dict_many(klass, values) == [
+            klass(**item) for item in values
+        ]
+        from_dict = DictSerializable.resolve_from_dict(list[klass])
+        assert from_dict(values) == [klass(**item) for item in values]
+        assert DictSerializable.from_dict(list[klass], values) == [
+            klass(**item) for item in values
+        ]
+
+    def test_to_dict_with_dict(self):
+        assert DictSerializable.to_dict(self.simple_model) is self.simple_model
+        to_dict = DictSerializable.resolve_to_dict(DataclassFact)
+        assert to_dict(self.simple_model) is self.simple_model
+
     @pytest.mark.parametrize(
-        "input_data",
+        "convert, error",
         [
-            DataclassComplexModel(current_page=1, data=[DataclassFact(**simple_model)]),
-            AttrsComplexModel(current_page=1, data=[AttrsFact(**simple_model)]),
-            PydanticComplexModel(current_page=1, data=[PydanticFact(**simple_model)]),
+            (partial(DictSerializable.to_dict, object()), DictDeserializationError),
+            # All other deserializers will require a valid instance to start with
+            (
+                partial(
+                    DictSerializable.from_dict, DataclassComplexModel, invalid_model
+                ),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.from_dict, AttrsComplexModel, invalid_model),
+                DictSerializationError,
+            ),
+            (
+                partial(
+                    DictSerializable.from_dict, PydanticComplexModel, invalid_model
+                ),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.from_dict, AttrsRejectedFact, {"fact": "x"}),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.from_dict, object, invalid_model),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.from_dict, list[AttrsFact], [invalid_model]),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.from_dict, list[AttrsFact], None),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.from_dict, list[AttrsFact], 5),
+                DictSerializationError,
+            ),
+            (
+                partial(DictSerializable.resolve_from_json(list[AttrsFact]), b"null"),
+                DictSerializationError,
+            ),
         ],
     )
-    def test_to_and_from_complex_model(self, input_data):
-        assert DictSerializable.to_dict(input_data) == self.complex_model
-        assert (
-            DictSerializable.from_dict(type(input_data), self.complex_model)
-            == input_data
-        )
+    def test_with_invalid_input(self, convert, error):
+        with pytest.raises(error):
+            convert()
+
+    def test_resolved_to_and_from_complex_model(self, complex_instance):
+        to_dict = DictSerializable.resolve_to_dict(type(complex_instance))
+        from_dict = DictSerializable.resolve_from_dict(type(complex_instance))
+        assert to_dict(complex_instance) == self.complex_model
+        assert from_dict(self.complex_model) == complex_instance
+
+    @pytest.mark.parametrize("klass", [FrozenDataclassFacts, FrozenAttrsFacts])
+    def test_resolved_to_dict_converts_frozen_instance_again(self, klass):
+        input_data = klass(facts=["fact"])
+        to_dict = DictSerializable.resolve_to_dict(klass)
+        assert to_dict(input_data) == {"facts": ["fact"]}
+        input_data.facts.append("other fact")
+        assert to_dict(input_data) == {"facts": ["fact", "other fact"]}
+
+    def test_resolved_to_dict_converts_mutable_instance_again(self):
+        input_data = DataclassFact(**self.simple_model)
+        to_dict = DictSerializable.resolve_to_dict(DataclassFact)
+        assert to_dict(input_data) == self.simple_model
+        input_data.length = 5
+        assert to_dict(input_data) == {"fact": "fact", "length": 5}
 
     @pytest.mark.parametrize(
-        "instance",
-        [
-            object(),
-            # All other serializers will require a valid instance to start with
-        ],
+        "klass", [DataclassComplexModel, AttrsComplexModel, PydanticComplexModel]
     )
-    def test_to_dict_with_invalid_input(self, instance):
-        with pytest.raises(DictDeserializationError):
-            DictSerializable.to_dict(instance)
+    def test_resolved_to_dict_omits_defaults(self, klass):
+        to_dict = DictSerializable.resolve_to_dict(klass, omit_defaults=True)
+        assert to_dict(klass(current_page=1)) == {"current_page": 1}
+
+    def test_cached_resolved_from_dict(self):
+        from_dict = DictSerializable.resolve_from_dict(
+            DataclassComplexModel, cached=True
+        )
+        instance = from_dict(self.complex_model)
+        assert instance == DataclassComplexModel(
+            current_page=1, data=[DataclassFact(**self.simple_model)]
+        )
+        assert from_dict(dict(self.complex_model)) is instance
+        assert from_dict({**self.complex_model, "current_page": 2}) is not instance
+
+        DictSerializable.cache_clear()
+        assert from_dict(self.complex_model) is not instance
+
+    def test_cached_resolved_from_dict_with_invalid_input(self):
+        from_dict = DictSerializable.resolve_from_dict(
+            DataclassComplexModel, cached=True
+        )
+        with pytest.raises(DictSerializationError):
+            from_dict(self.invalid_model)
+
+    @pytest.mark.parametrize("klass", [DataclassEmpty, AttrsEmpty, PydanticEmpty])
+    def test_resolved_to_dict_reuses_dict_for_empty_instance(self, klass):
+        input_data = klass()
+        to_dict = DictSerializable.resolve_to_dict(klass)
+        values = to_dict(input_data)
+        assert values == {}
+        assert to_dict(input_data) is values
 
+    def test_resolved_from_json(self):
+        from_json = DictSerializable.resolve_from_json(AttrsFact)
+        assert from_json(b'{"fact": "fact", "length": 4}') == AttrsFact(
+            **self.simple_model
+        )
+
+    @pytest.mark.parametrize("cached", [False, True])
+    @pytest.mark.parametrize("parser", ["json", "orjson", "msgspec"])
+    def test_resolved_from_json_with_invalid_json(self, monkeypatch, parser, cached):
+        module = pytest.importorskip(parser)
+        loads = module.json.decode if parser == "msgspec" else module.loads
+        monkeypatch.setattr(serializers, "_json_loads", loads)
+
+        from_json = DictSerializable.resolve_from_json(AttrsFact, cached=cached)
+        with pytest.raises(DictSerializationError):
+            from_json(b'{"fact": "fact",')
+
+    @pytest.mark.parametrize("parser", ["json", "orjson", "msgspec"])
     @pytest.mark.parametrize(
-        "klass, input_data",
+        "content",
         [
-            (DataclassComplexModel, invalid_model),
-            (AttrsComplexModel, invalid_model),
-            (PydanticComplexModel, invalid_model),
-            (object, invalid_model),
+            b'\xef\xbb\xbf{"fact": "fact", "length": 4}',
+            '{"fact": "fact", "length": 4}'.encode("utf-16"),
         ],
     )
-    def test_from_dict_with_invalid_input(self, klass, input_data):
+    def test_resolved_from_json_with_other_encoding(self, monkeypatch, parser, content):
+        module = pytest.importorskip(parser)
+        loads = module.json.decode if parser == "msgspec" else module.loads
+        monkeypatch.setattr(serializers, "_json_loads", loads)
+
+        from_json = DictSerializable.resolve_from_json(AttrsFact)
+        assert from_json(content) == AttrsFact(**self.simple_model)
+
+    def test_cached_resolved_from_json(self):
+        from_json = DictSerializable.resolve_from_json(AttrsFact, cached=True)
+        instance = from_json(b'{"fact": "fact", "length": 4}')
+        assert instance == AttrsFact(**self.simple_model)
+        assert from_json(b'{"fact": "fact", "length": 4}') is instance
+
+    def test_subclass_does_not_share_serializers(self):
+        class AttrsOnly(DictSerializable):
+            serializers = (AttrsSerializer,)
+            deserializers = (AttrsDeserializer,)
+
+        instance = DataclassFact(**self.simple_model)
+        assert DictSerializable.to_dict(instance) == self.simple_model
+        assert DictSerializable.from_dict(DataclassFact, self.simple_model) == instance
+        with pytest.raises(DictDeserializationError):
+            AttrsOnly.to_dict(instance)
         with pytest.raises(DictSerializationError):
-            DictSerializable.from_dict(klass, input_data)
+            AttrsOnly.from_dict(DataclassFact, self.simple_model)
+
+    def test_subclass_with_other_deserializers(self):
+        class DataclassToDictOnly(DictSerializable):
+            serializers = (AttrsSerializer,)
+            deserializers = (PydanticDeserializer, DataclassDeserializer)
+
+        instance = DataclassFact(**self.simple_model)
+        to_dict = DataclassToDictOnly.resolve_to_dict(DataclassFact)
+        assert to_dict(instance) == self.simple_model
+
+    def test_subclass_with_custom_deserializer(self):
+        class UpperFactDeserializer:
+            @classmethod
+            def can_apply(cls, instance):
+                return isinstance(instance, DataclassFact)
+
+            @classmethod
+            def to_dict(cls, instance):
+                return {"fact": instance.fact.upper(), "length": instance.length}
+
+        class UpperFact(DictSerializable):
+            deserializers = (UpperFactDeserializer, DataclassDeserializer)
+
+        to_dict = UpperFact.resolve_to_dict(DataclassFact)
+        assert to_dict(DataclassFact(**self.simple_model)) == {
+            "fact": "FACT",
+            "length": 4,
+        }